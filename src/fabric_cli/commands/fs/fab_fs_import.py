@@ -3,7 +3,6 @@
 
 from argparse import Namespace
 
-from fabric_cli.commands.fs.impor import fab_fs_import_item as import_item
 from fabric_cli.core.hiearchy.fab_hiearchy import FabricElement, Item
 from fabric_cli.utils import fab_util as utils
 
@@ -12,4 +11,8 @@ def exec_command(args: Namespace, context: FabricElement) -> None:
     args.input = utils.process_nargs(args.input)
 
     if isinstance(context, Item):
+        # Deferred so that loading the fs command group does not pull in the
+        # import-item dependencies for unrelated commands (ls, cd, ...)
+        from fabric_cli.commands.fs.impor import fab_fs_import_item as import_item
+
         import_item.import_single_item(context, args)
@@ -44,6 +44,8 @@ AZURE_TOKEN_AUDIENCE = ["https://management.azure.com"]
 AUTH_DEFAULT_AUTHORITY = "https://login.microsoftonline.com/common"
 AUTH_DEFAULT_CLIENT_ID = "5814bfb4-2705-4994-b8d6-39aabeb5eaeb"
 AUTH_TENANT_AUTHORITY = "https://login.microsoftonline.com/"
+# Cached access tokens are refreshed when they expire within this window
+AUTH_TOKEN_REFRESH_MARGIN_SECONDS = 300
 
 # Env variables
 FAB_TOKEN = "fab_token"
@@ -315,9 +317,9 @@ DEBUG = False
 INTERACTIVE_EXIT_MESSAGE = "Exiting interactive mode. Goodbye!"
 
 # Interactive command constants
-INTERACTIVE_QUIT_COMMANDS = ["quit", "q", "exit"]
-INTERACTIVE_HELP_COMMANDS = ["help", "h", "-h", "--help"]
-INTERACTIVE_VERSION_COMMANDS = ["version", "v", "-v", "--version"]
+INTERACTIVE_QUIT_COMMANDS = frozenset({"quit", "q", "exit"})
+INTERACTIVE_HELP_COMMANDS = frozenset({"help", "h", "-h", "--help"})
+INTERACTIVE_VERSION_COMMANDS = frozenset({"version", "v", "-v", "--version"})
 
 # Platform metadata
 ITEM_METADATA_PROPERTIES = {
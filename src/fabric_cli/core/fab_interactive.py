@@ -2,7 +2,6 @@
 # Licensed under the MIT License.
 
 import html
-import shlex
 
 from prompt_toolkit import HTML, PromptSession
 from prompt_toolkit.cursor_shapes import CursorShape
@@ -13,8 +12,10 @@ from fabric_cli.core import fab_constant, fab_logger
 from fabric_cli.core.fab_commands import Command
 from fabric_cli.core.fab_context import Context
 from fabric_cli.core.fab_decorators import singleton
+from fabric_cli.core.fab_exceptions import FabricCLIError
 from fabric_cli.utils import fab_commands
 from fabric_cli.utils import fab_ui as utils_ui
+from fabric_cli.utils import fab_util as utils
 from fabric_cli.core.fab_parser_setup import get_global_parser_and_subparsers
 
 @singleton
@@ -47,25 +48,32 @@ class InteractiveCLI:
         """Process the user command."""
         fab_logger.print_log_file_path()
 
-        command_parts = shlex.split(command.strip())
+        stripped = command.strip()
 
-        if command in fab_constant.INTERACTIVE_QUIT_COMMANDS:
+        # Special commands are matched before tokenizing, so they skip splitting
+        if stripped in fab_constant.INTERACTIVE_QUIT_COMMANDS:
             utils_ui.print(fab_constant.INTERACTIVE_EXIT_MESSAGE)
             return True
-        elif command in fab_constant.INTERACTIVE_HELP_COMMANDS:
+        elif stripped in fab_constant.INTERACTIVE_HELP_COMMANDS:
             utils_ui.display_help(
                 fab_commands.COMMANDS, "Usage: <command> <subcommand> [flags]"
             )
             return False
-        elif command in fab_constant.INTERACTIVE_VERSION_COMMANDS:
+        elif stripped in fab_constant.INTERACTIVE_VERSION_COMMANDS:
             utils_ui.print_version()
             return False
-        elif command.strip() == "fab":
+        elif stripped == "fab":
             utils_ui.print(
                 "In interactive mode, commands don't require the fab prefix. Use --help to view the list of supported commands."
             )
             return False
-        elif not command.strip():
+        elif not stripped:
+            return False
+
+        try:
+            command_parts = utils.split_command(stripped)
+        except FabricCLIError as err:
+            utils_ui.print_output_error(err)
             return False
 
         self.parser.set_mode(fab_constant.FAB_MODE_INTERACTIVE)
@@ -73,9 +81,8 @@ class InteractiveCLI:
         # Now check for subcommands
         if command_parts:  # Only if there's something to process
             subcommand_name = command_parts[0]
-            if subcommand_name in self.subparsers.choices:
-                subparser = self.subparsers.choices[subcommand_name]
-
+            subparser = self.subparsers.choices.get(subcommand_name)
+            if subparser is not None:
                 try:
                     subparser_args = subparser.parse_args(command_parts[1:])
                     subparser_args.command = subcommand_name
@@ -90,13 +97,13 @@ class InteractiveCLI:
                         subparser_args.func(subparser_args)
                     else:
                         utils_ui.print(
-                            f"No function associated with the command: {command.strip()}"
+                            f"No function associated with the command: {stripped}"
                         )
                 except SystemExit:
                     # Catch SystemExit raised by ArgumentParser and prevent exiting
                     return
             else:
-                self.parser.error(f"invalid choice: '{command.strip()}'. Type 'help' for available commands.")
+                self.parser.error(f"invalid choice: '{stripped}'. Type 'help' for available commands.")
 
         return False
 
@@ -112,14 +119,19 @@ class InteractiveCLI:
             utils_ui.print("\nWelcome to the Fabric CLI ⚡")
             utils_ui.print("Type 'help' for help. \n")
 
+            # The prompt is only rebuilt when the current context path changes
+            last_pwd_context = None
+            prompt_text = None
             while True:
                 try:
                     context = Context().context
                     pwd_context = f"/{context.path.strip('/')}"
 
-                    prompt_text = HTML(
-                        f"<prompt>fab</prompt><detail>:</detail><context>{html.escape(pwd_context)}</context><detail>$</detail> "
-                    )
+                    if pwd_context != last_pwd_context:
+                        prompt_text = HTML(
+                            f"<prompt>fab</prompt><detail>:</detail><context>{html.escape(pwd_context)}</context><detail>$</detail> "
+                        )
+                        last_pwd_context = pwd_context
 
                     user_input = self.session.prompt(
                         prompt_text,
@@ -5,8 +5,6 @@ import argparse
 import re
 import sys
 
-import argcomplete
-
 from fabric_cli.core import fab_constant, fab_logger
 from fabric_cli.parsers import fab_acls_parser as acls_parser
 from fabric_cli.parsers import fab_api_parser as api_parser
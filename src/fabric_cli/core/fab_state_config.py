@@ -17,6 +17,9 @@ def config_location():
 
 config_file = os.path.join(config_location(), "config.json")
 
+# Last parsed config file as (path, (mtime_ns, size), data), reused by get_config
+_config_cache = None
+
 
 def read_config(file_path) -> dict:
     try:
@@ -29,19 +32,50 @@ def read_config(file_path) -> dict:
 
 
 def write_config(data):
+    global _config_cache
+    _config_cache = None
     with open(config_file, "w") as file:
         json.dump(data, file, indent=4)
 
 
+def _read_config_cached() -> dict:
+    """
+    Returns the parsed config file, reparsing it only when its path, mtime or size change.
+    """
+    global _config_cache
+    try:
+        file_stat = os.stat(config_file)
+    except OSError:
+        return {}
+    stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    if (
+        _config_cache is not None
+        and _config_cache[0] == config_file
+        and _config_cache[1] == stamp
+    ):
+        return _config_cache[2]
+    config = read_config(config_file)
+    _config_cache = (config_file, stamp, config)
+    return config
+
+
 def set_config(key, value):
     config = read_config(config_file)
     config[key] = value
     write_config(config)
 
 
-def get_config(key):
+def set_configs(values: dict):
+    """
+    Sets several config keys with a single read and write of the config file.
+    """
     config = read_config(config_file)
-    return config.get(key)
+    config.update(values)
+    write_config(config)
+
+
+def get_config(key):
+    return _read_config_cached().get(key)
 
 
 def list_configs():
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+from functools import cached_property
 from typing import List
 
 from fabric_cli.core import fab_constant
@@ -19,6 +20,22 @@ from fabric_cli.core.hiearchy.fab_workspace import Workspace
 from fabric_cli.errors import ErrorMessages
 
 
+def _flatten_mutable_props(props: List[dict[str, str]]) -> dict[str, str]:
+    flat: dict[str, str] = {}
+    for prop in props:
+        for key, path in prop.items():
+            # Keep the first mapping of a key, as the original list scan did
+            flat.setdefault(key, path)
+    return flat
+
+
+# ITMutablePropMap flattened once per item type, for single-lookup resolution
+_FRIENDLY_PROPS_BY_TYPE: dict[ItemType, dict[str, str]] = {
+    item_type: _flatten_mutable_props(props)
+    for item_type, props in ITMutablePropMap.items()
+}
+
+
 class Item(_BaseItem):
     @staticmethod
     def validate_name(name) -> tuple[str, ItemType]:
@@ -30,6 +47,8 @@ class Item(_BaseItem):
         else:
             _type = ItemType.from_string(str(item_type))
 
+        # The parent is checked once here instead of on every parent access
+        assert isinstance(parent, (Workspace, Folder))
         super().__init__(name, id, FabricElementType.ITEM, parent, _type)
 
     @property
@@ -52,27 +71,22 @@ class Item(_BaseItem):
         return self.parent.id if isinstance(self.parent, Folder) else None
 
     def extract_friendly_name_path_or_default(self, key: str) -> str:
-        item_type = self.item_type
-
-        if item_type in ITMutablePropMap:
-            for prop in ITMutablePropMap[item_type]:
-                if key in prop:
-                    return prop[key]
-        return key
+        friendly_props = _FRIENDLY_PROPS_BY_TYPE.get(self.item_type)
+        if friendly_props is None:
+            return key
+        return friendly_props.get(key, key)
 
     @property
     def parent(self) -> Workspace | Folder:
-        _parent = super().parent
-        assert isinstance(_parent, Workspace) or isinstance(_parent, Folder)
-        return _parent
+        return self._parent
 
-    @property
+    @cached_property
     def workspace(self) -> Workspace:
-        if isinstance(self.parent, Workspace):
-            return self.parent
-        else:
-            assert isinstance(self.parent, Folder)
-            return self.parent.workspace
+        # Folders only move within their workspace, so this never changes
+        _parent = self._parent
+        if isinstance(_parent, Workspace):
+            return _parent
+        return _parent.workspace
 
     def get_folders(self) -> List[str]:
         return ItemFoldersMap.get(self.item_type, [])
@@ -36,6 +36,10 @@ class AuthErrors:
     def spn_auth_missing_credential() -> str:
         return "Authentication credential is missing. Either FAB_SPN_CLIENT_SECRET, FAB_SPN_CERT_PATH or FAB_SPN_FEDERATED_TOKEN must be set"
 
+    @staticmethod
+    def spn_auth_multiple_credentials(credential_vars: list[str]) -> str:
+        return f"Multiple authentication credentials are set ({', '.join(credential_vars)}). Only one of FAB_SPN_CLIENT_SECRET, FAB_SPN_CERT_PATH or FAB_SPN_FEDERATED_TOKEN can be set"
+
     @staticmethod
     def encrypted_cache_error() -> str:
         return "An error occurred with the encrypted cache. Enable plaintext auth token fallback with 'config set encryption_fallback_enabled true'"
@@ -48,10 +52,6 @@ class AuthErrors:
     def tenant_id_env_var_required() -> str:
         return "FAB_TENANT_ID must be set for SPN authentication"
 
-    @staticmethod
-    def public_key_not_found() -> str:
-        return "Public key not found in JWKS"
-
     @staticmethod
     def invalid_scope(scope: str) -> str:
         return f"Invalid scope '{scope}'"
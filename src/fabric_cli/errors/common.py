@@ -257,3 +257,6 @@ class CommonErrors:
             message = "No formats are supported"
         return f"Invalid format. {message}"
 
+    @staticmethod
+    def invalid_command_syntax(command: str, error: str) -> str:
+        return f"Unable to parse command '{command}': {error}. Quote arguments that contain quotes or spaces, e.g. \"John's.Workspace\""
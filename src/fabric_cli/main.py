@@ -1,22 +1,26 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import os
 import sys
 
-import argcomplete
-
 from fabric_cli.core import fab_constant, fab_logger, fab_state_config
 from fabric_cli.core.fab_commands import Command
 from fabric_cli.core.fab_exceptions import FabricCLIError
 from fabric_cli.core.fab_parser_setup import get_global_parser_and_subparsers
 from fabric_cli.parsers import fab_auth_parser as auth_parser
 from fabric_cli.utils import fab_ui
+from fabric_cli.utils import fab_util as utils
 
 
 def main():
     parser, subparsers = get_global_parser_and_subparsers()
 
-    argcomplete.autocomplete(parser, default_completer=None)
+    # argcomplete only has work to do when the shell invokes us for completion
+    if "_ARGCOMPLETE" in os.environ:
+        import argcomplete
+
+        argcomplete.autocomplete(parser, default_completer=None)
 
     args = parser.parse_args()
 
@@ -55,7 +59,13 @@ def main():
                 if isinstance(args.command, list):
                     commands_execs = 0
                     for index, command in enumerate(args.command):
-                        command_parts = command.strip().split()
+                        try:
+                            command_parts = utils.split_command(command)
+                        except FabricCLIError as err:
+                            fab_ui.print_output_error(
+                                err, output_format_type=args.output_format
+                            )
+                            sys.exit(fab_constant.EXIT_CODE_ERROR)
                         if command_parts:  # Ensure we have valid command parts
                             subparser = subparsers.choices[command_parts[0]]
                             subparser_args = subparser.parse_args(command_parts[1:])
@@ -36,6 +36,10 @@ from fabric_cli.core.hiearchy.fab_hiearchy import FabricElement, Item, OneLakeIt
 from fabric_cli.errors import ErrorMessages
 from fabric_cli.utils import fab_ui
 
+_EDS_SUPPORTED_ITEM_TYPES = frozenset(
+    {ItemType.LAKEHOUSE, ItemType.KQL_DATABASE, ItemType.WAREHOUSE}
+)
+
 
 def obtain_id_names_for_onelake(
     from_context: OneLakeItem, to_context: OneLakeItem
@@ -52,7 +56,8 @@ def extract_paths(context: FabricElement) -> tuple:
 
 
 def _get_elem_type(elem: FabricElement) -> str:
-    return str(elem.item_type.name) if isinstance(elem, Item) else str(elem.type)
+    # Enum names are already str; FabricElementType needs str() for its camel case
+    return elem.item_type.name if isinstance(elem, Item) else str(elem.type)
 
 
 def sort_ws_elems_by_config(
@@ -105,17 +110,17 @@ def get_item_with_definition(
 
 
 def get_external_data_share_name(item_name: str, eds_id: str) -> str:
-    return item_name + "_" + eds_id.split("-")[0]
+    eds_id_prefix = eds_id.partition("-")[0]
+    return f"{item_name}_{eds_id_prefix}"
 
 
 def get_item_name_from_eds_name(eds_name) -> str:
-    parts = eds_name.split("_")
-    item_name = "_".join(parts[:-1])
+    item_name = eds_name.rpartition("_")[0]
     return item_name
 
 
-def item_types_supporting_external_data_shares() -> list:
-    return [ItemType.LAKEHOUSE, ItemType.KQL_DATABASE, ItemType.WAREHOUSE]
+def item_types_supporting_external_data_shares() -> frozenset[ItemType]:
+    return _EDS_SUPPORTED_ITEM_TYPES
 
 
 def item_sensitivity_label_warnings(args: Namespace, action: str) -> None:
@@ -29,8 +29,13 @@ def lazy_command(module_path: str, func_name: str):
         func_name: Name of the callable inside *module_path*, e.g. ``"ls_command"``.
     """
 
+    mod = None
+
     def wrapper(args):
-        mod = importlib.import_module(module_path)
+        nonlocal mod
+        if mod is None:
+            mod = importlib.import_module(module_path)
+        # Resolved per call so patching the module attribute still takes effect
         return getattr(mod, func_name)(args)
 
     return wrapper
@@ -878,9 +878,10 @@ def get_external_data_shares(
     args.ws_id = container.id
 
     ws_items = get_workspace_items(container)
+    eds_item_types = item_utils.item_types_supporting_external_data_shares()
 
     for item in ws_items:
-        if item.item_type in item_utils.item_types_supporting_external_data_shares():
+        if item.item_type in eds_item_types:
             external_data_shares_for_item = get_external_data_shares_for_item(
                 container, item
             )
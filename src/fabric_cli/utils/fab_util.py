@@ -20,6 +20,7 @@ The module includes functions for:
 import json
 import platform
 import re
+import shlex
 from typing import Any
 
 from fabric_cli.core import fab_constant, fab_state_config
@@ -174,6 +175,43 @@ def get_os_specific_command(command: str) -> str:
         return fab_constant.OS_COMMANDS.get(command, {}).get("unix", command)
 
 
+def split_command(command: str) -> list[str]:
+    """Split a command line into arguments, keeping quoted arguments intact.
+
+    Used for both `fab -c` commands and interactive mode input, so a command
+    tokenizes the same way in both.
+
+    Args:
+        command: The command line to split
+
+    Returns:
+        List of command arguments
+
+    Raises:
+        FabricCLIError: If the command has unbalanced quotes
+    """
+    # POSIX rules treat backslashes as escapes, which would drop the separators
+    # of Windows paths, so Windows uses non-POSIX rules and strips the quotes
+    posix = platform.system() != "Windows"
+    try:
+        parts = shlex.split(command, posix=posix)
+    except ValueError as e:
+        raise FabricCLIError(
+            ErrorMessages.Common.invalid_command_syntax(command, str(e)),
+            fab_constant.ERROR_INVALID_INPUT,
+        )
+    if not posix:
+        parts = [
+            (
+                part[1:-1]
+                if len(part) > 1 and part[0] in "'\"" and part[-1] == part[0]
+                else part
+            )
+            for part in parts
+        ]
+    return parts
+
+
 def replace_bypath_to_byconnection() -> bool:
     return True
 
@@ -874,27 +874,18 @@ class TestAuth:
         mock_fab_context_instance.reset_context.assert_called_once()
 
         mock_fab_state_config_instance = mock_fab_state_config.get("instance")
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_DEFAULT_CAPACITY, ""
-        )
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_DEFAULT_CAPACITY_ID, ""
-        )
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_LOCAL_DEFINITION_LABELS, ""
-        )
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_DEFAULT_AZ_SUBSCRIPTION_ID, ""
-        )
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_DEFAULT_AZ_ADMIN, ""
-        )
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_DEFAULT_AZ_RESOURCE_GROUP, ""
-        )
-        mock_fab_state_config_instance.set_config.assert_any_call(
-            fab_constant.FAB_DEFAULT_AZ_LOCATION, ""
-        )
+        mock_fab_state_config_instance.set_configs.assert_called_once()
+        resets = mock_fab_state_config_instance.set_configs.call_args.args[0]
+        for key in [
+            fab_constant.FAB_DEFAULT_CAPACITY,
+            fab_constant.FAB_DEFAULT_CAPACITY_ID,
+            fab_constant.FAB_LOCAL_DEFINITION_LABELS,
+            fab_constant.FAB_DEFAULT_AZ_SUBSCRIPTION_ID,
+            fab_constant.FAB_DEFAULT_AZ_ADMIN,
+            fab_constant.FAB_DEFAULT_AZ_RESOURCE_GROUP,
+            fab_constant.FAB_DEFAULT_AZ_LOCATION,
+        ]:
+            assert resets[key] == ""
 
         mock_print_done.assert_called_once()
 
@@ -1039,5 +1030,7 @@ def mock_fab_context():
 @pytest.fixture()
 def mock_fab_state_config():
     fab_state_config_instance = fab_state_config
-    with patch.multiple(fab_state_config_instance, set_config=MagicMock()) as mocks:
+    with patch.multiple(
+        fab_state_config_instance, set_config=MagicMock(), set_configs=MagicMock()
+    ) as mocks:
         yield {"instance": fab_state_config_instance, **mocks}
@@ -5,6 +5,7 @@ import datetime
 import json
 import os
 import tempfile
+import time
 import uuid
 from unittest.mock import patch
 
@@ -17,9 +18,11 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.serialization import pkcs12
 from cryptography.x509.oid import NameOID
 
+from fabric_cli.core import fab_auth as fab_auth_module
 from fabric_cli.core import fab_constant as con
 from fabric_cli.core.fab_auth import FabAuth
 from fabric_cli.core.fab_exceptions import FabricCLIError
+from fabric_cli.core.fab_msal_bridge import MsalTokenCredential
 
 
 @pytest.fixture(autouse=True)
@@ -32,9 +35,6 @@ def temp_dir_fixture(monkeypatch, tmp_path):
 
 
 DUMMY_TOKEN = "dummy.token.value"
-DUMMY_PAYLOAD = {"sub": "123", "aud": "test_audience"}
-DUMMY_KEY_VALID = "dummy_key_valid"
-DUMMY_KEY_INVALID = "dummy_key_invalid"
 
 
 def _clear_environment_variables(monkeypatch):
@@ -136,12 +136,76 @@ def test_load_pem_certificate(monkeypatch):
         auth = FabAuth()
         cert = auth._parse_certificate(cert_path, cert_password)
         assert "private_key" in cert
-        assert "thumbprint" in cert
+        expected_thumbprint = (
+            x509.load_pem_x509_certificate(cert_data)
+            .fingerprint(hashes.SHA1())
+            .hex()
+        )
+        assert cert["thumbprint"] == expected_thumbprint
     finally:
         # Clean up temporary file
         os.remove(cert_path)
 
 
+def test_parse_certificate_cached_until_file_changes(monkeypatch):
+    cert_data = _generate_test_certificate()
+    with tempfile.NamedTemporaryFile(
+        mode="w+b", suffix=".pem", delete=False
+    ) as temp_file:
+        temp_file.write(cert_data)
+        cert_path = temp_file.name
+
+    try:
+        _clear_environment_variables(monkeypatch)
+        auth = FabAuth()
+        auth._cert_cache = {}
+        load_calls = []
+        original_load = auth._load_pem_certificate
+
+        def counting_load(certificate_data, password=None):
+            load_calls.append(certificate_data)
+            return original_load(certificate_data, password)
+
+        monkeypatch.setattr(auth, "_load_pem_certificate", counting_load)
+
+        first = auth._parse_certificate(cert_path)
+        assert auth._parse_certificate(cert_path) == first
+        assert len(load_calls) == 1
+
+        # A different password or a rewritten file is parsed again
+        with pytest.raises(FabricCLIError):
+            auth._parse_certificate(cert_path, "other_password")
+        os.utime(cert_path, ns=(0, 0))
+        assert auth._parse_certificate(cert_path) == first
+        assert len(load_calls) == 3
+    finally:
+        os.remove(cert_path)
+
+
+def test_sha1_fingerprint_matches_cryptography_fingerprint():
+    cert = x509.load_pem_x509_certificate(_generate_test_certificate())
+    assert FabAuth._sha1_fingerprint(cert) == cert.fingerprint(hashes.SHA1())
+
+
+@pytest.mark.parametrize("suffix", [".crt", ".PEM"])
+def test_parse_certificate_unsupported_extension(monkeypatch, suffix):
+    with tempfile.NamedTemporaryFile(
+        mode="w+b", suffix=suffix, delete=False
+    ) as temp_file:
+        temp_file.write(_generate_test_certificate())
+        cert_path = temp_file.name
+
+    try:
+        _clear_environment_variables(monkeypatch)
+        auth = FabAuth()
+        with pytest.raises(FabricCLIError) as e:
+            auth._parse_certificate(cert_path)
+        assert e.value.status_code == con.ERROR_INVALID_CERTIFICATE
+        assert "The certificate file format is invalid" in e.value.message
+    finally:
+        os.remove(cert_path)
+
+
 def test_load_pem_certificate_invalid(monkeypatch):
     # This test is to check if the function raises an error when loading an invalid certificate
     # Create an invalid certificate file (just a private key without certificate part)
@@ -437,73 +501,12 @@ def test_validate_jwt_token_empty():
     assert e.value.message == "Invalid JWT token"
 
 
-def test_decode_jwt_token_with_cached_key_success(monkeypatch):
+def test_decode_jwt_token_failure(monkeypatch):
     auth = FabAuth()
-    # Set a valid cached key
-    auth.aad_public_key = DUMMY_KEY_VALID
 
-    # Patch jwt.decode to simulate successful decoding with cached key
-    def fake_jwt_decode(token, key, algorithms, audience, options):
-        assert token == DUMMY_TOKEN
-        assert key == DUMMY_KEY_VALID
-        assert algorithms == ["RS256"]
-        assert audience == "test_audience"
-        return DUMMY_PAYLOAD
-
-    monkeypatch.setattr(jwt, "decode", fake_jwt_decode)
-
-    payload = auth._decode_jwt_token(DUMMY_TOKEN, expected_audience="test_audience")
-    assert payload == DUMMY_PAYLOAD
-
-
-def test_decode_jwt_token_with_cached_key_failure_then_fetch(monkeypatch):
-    auth = FabAuth()
-    # Set an invalid cached key so that the first attempt fails
-    auth.aad_public_key = DUMMY_KEY_INVALID
-
-    call_history = {"decode_calls": []}
-
-    # Create a fake jwt.decode which raises an exception when called with the invalid key,
-    # but succeeds when called with the valid key.
-    def fake_jwt_decode(token, key, algorithms, audience, options):
-        call_history["decode_calls"].append(key)
-        if key == DUMMY_KEY_INVALID:
-            raise Exception("Invalid cached key")
-        elif key == DUMMY_KEY_VALID:
-            return DUMMY_PAYLOAD
-        else:
-            raise Exception("Unexpected key used")
-
-    monkeypatch.setattr(jwt, "decode", fake_jwt_decode)
-
-    # Patch _fetch_public_key_from_aad to return a new valid key
-    def fake_fetch_public_key(token):
-        assert token == DUMMY_TOKEN
-        return DUMMY_KEY_VALID
-
-    monkeypatch.setattr(auth, "_fetch_public_key_from_aad", fake_fetch_public_key)
-
-    payload = auth._decode_jwt_token(DUMMY_TOKEN, expected_audience="test_audience")
-    # Verify that the cached key was replaced with the new valid key
-    assert auth.aad_public_key == DUMMY_KEY_VALID
-    assert payload == DUMMY_PAYLOAD
-    # Ensure that jwt.decode was first called with the invalid key, then with the fetched key
-    assert call_history["decode_calls"] == [DUMMY_KEY_INVALID, DUMMY_KEY_VALID]
-
-
-def test_decode_jwt_token_failure_after_fetch(monkeypatch):
-    auth = FabAuth()
-    auth.aad_public_key = None  # No cached key
-
-    # Patch _fetch_public_key_from_aad to return a valid key
-    def fake_fetch_public_key(token):
-        return DUMMY_KEY_VALID
-
-    monkeypatch.setattr(auth, "_fetch_public_key_from_aad", fake_fetch_public_key)
-
-    # Patch jwt.decode to always raise an Exception even with the fetched key
-    def fake_jwt_decode(token, key, algorithms, audience, options):
-        raise Exception("Decoding failed with new key")
+    # Patch jwt.decode to always raise an Exception
+    def fake_jwt_decode(token, algorithms, audience, options):
+        raise Exception("Decoding failed")
 
     monkeypatch.setattr(jwt, "decode", fake_jwt_decode)
 
@@ -513,69 +516,23 @@ def test_decode_jwt_token_failure_after_fetch(monkeypatch):
     assert "Failed to decode JWT token" in str(exc_info.value)
 
 
-def fake_response_success(jwks):
-    class FakeResponse:
-        def json(self):
-            return jwks
-
-    return FakeResponse()
-
-
-def test_fetch_public_key_success(monkeypatch):
+def test_decode_jwt_token_validates_audience_and_expiry():
     auth = FabAuth()
-    # Setup a fake JWKS response with one key
-    fake_kid = "kid1"
-    fake_jwk = {
-        "kid": fake_kid,
-        "kty": "RSA",
-        "n": "dummy_n",
-        "e": "dummy_e",
-        "alg": "RS256",
-        "use": "sig",
-    }
-    jwks = {"keys": [fake_jwk]}
-
-    # Patch requests.get to return our fake JWKS
-    monkeypatch.setattr(requests, "get", lambda url: fake_response_success(jwks))
-    # Patch jwt.get_unverified_header to return a header with our fake kid
-    monkeypatch.setattr(jwt, "get_unverified_header", lambda token: {"kid": fake_kid})
-    # Patch jwt.algorithms.RSAAlgorithm.from_jwk to simply return the JSON string of the jwk for testing
-    monkeypatch.setattr(
-        jwt.algorithms.RSAAlgorithm, "from_jwk", lambda jwk_str: json.loads(jwk_str)
-    )
 
-    key = auth._fetch_public_key_from_aad(DUMMY_TOKEN)
-    # The returned key should be equal to the fake_jwk dictionary
-    assert key == fake_jwk
+    token = jwt.encode({"aud": "test_audience", "sub": "123"}, "k" * 32)
+    payload = auth._decode_jwt_token(token, expected_audience="test_audience")
+    assert payload["sub"] == "123"
 
+    with pytest.raises(FabricCLIError) as exc_info:
+        auth._decode_jwt_token(token, expected_audience="other_audience")
+    assert exc_info.value.status_code == con.ERROR_AUTHENTICATION_FAILED
 
-def test_fetch_public_key_not_found(monkeypatch):
-    auth = FabAuth()
-    # Setup a fake JWKS response with a key that doesn't match
-    fake_kid = "expected_kid"
-    fake_jwk = {
-        "kid": "other_kid",
-        "kty": "RSA",
-        "n": "dummy_n",
-        "e": "dummy_e",
-        "alg": "RS256",
-        "use": "sig",
-    }
-    jwks = {"keys": [fake_jwk]}
-
-    # Patch requests.get to return our fake JWKS
-    monkeypatch.setattr(requests, "get", lambda url: fake_response_success(jwks))
-    # Patch jwt.get_unverified_header to return a header with a kid that is not available in JWKS
-    monkeypatch.setattr(jwt, "get_unverified_header", lambda token: {"kid": fake_kid})
-    # Patch jwt.algorithms.RSAAlgorithm as before
-    monkeypatch.setattr(
-        jwt.algorithms.RSAAlgorithm, "from_jwk", lambda jwk_str: json.loads(jwk_str)
+    expired_token = jwt.encode(
+        {"aud": "test_audience", "exp": int(time.time()) - 60}, "k" * 32
     )
-
     with pytest.raises(FabricCLIError) as exc_info:
-        auth._fetch_public_key_from_aad(DUMMY_TOKEN)
+        auth._decode_jwt_token(expired_token, expected_audience="test_audience")
     assert exc_info.value.status_code == con.ERROR_AUTHENTICATION_FAILED
-    assert "Public key not found in JWKS" in str(exc_info.value.message)
 
 
 def test_get_token_claim_success(monkeypatch):
@@ -591,13 +548,11 @@ def test_get_token_claim_success(monkeypatch):
     monkeypatch.setattr(
         auth, "get_access_token", lambda scope, interactive_renew=False: dummy_token
     )
-    # Patch _decode_jwt_token to return our dummy payload.
+    # Patch _get_unverified_claims to return our dummy payload.
     monkeypatch.setattr(
         auth,
-        "_decode_jwt_token",
-        lambda token, expected_audience=None: (
-            dummy_payload if token == dummy_token else {}
-        ),
+        "_get_unverified_claims",
+        lambda token: (dummy_payload if token == dummy_token else {}),
     )
 
     result = auth.get_token_claims(dummy_scope, [dummy_claim_name])
@@ -616,9 +571,7 @@ def test_get_token_claim_missing_claim(monkeypatch):
     monkeypatch.setattr(
         auth, "get_access_token", lambda scope, interactive_renew=False: dummy_token
     )
-    monkeypatch.setattr(
-        auth, "_decode_jwt_token", lambda token, expected_audience=None: dummy_payload
-    )
+    monkeypatch.setattr(auth, "_get_unverified_claims", lambda token: dummy_payload)
 
     result = auth.get_token_claims(dummy_scope, [dummy_claim_name])
     assert result is None
@@ -673,7 +626,10 @@ def test_get_access_token_managed_identity_success(monkeypatch):
     assert token == "mi_token"
 
 
-def test_get_access_token_managed_identity_connection_error(monkeypatch):
+@pytest.mark.parametrize(
+    "error_type", [ConnectionError, requests.exceptions.ConnectionError]
+)
+def test_get_access_token_managed_identity_connection_error(monkeypatch, error_type):
     auth = FabAuth()
     # Force auth mode to managed_identity
     monkeypatch.setattr(
@@ -684,10 +640,10 @@ def test_get_access_token_managed_identity_connection_error(monkeypatch):
         ),
     )
 
-    # Fake app that raises ConnectionError when trying to acquire token
+    # Fake app that raises a connection error when trying to acquire token
     class FakeMIApp:
         def acquire_token_for_client(self, *, resource):
-            raise ConnectionError("Connection failed")
+            raise error_type("Connection failed")
 
     monkeypatch.setattr(auth, "_get_app", lambda: FakeMIApp())
     with pytest.raises(FabricCLIError) as exc_info:
@@ -738,6 +694,39 @@ def test_get_access_token_env_var(monkeypatch):
     assert token == "env_token"
 
 
+def test_get_access_token_from_env_vars_scope_lookup(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    monkeypatch.setenv("FAB_TOKEN", "fabric_env_token")
+    monkeypatch.setenv("FAB_TOKEN_ONELAKE", "onelake_env_token")
+
+    decoded = []
+    monkeypatch.setattr(
+        auth,
+        "_decode_jwt_token",
+        lambda token, expected_audience=None: decoded.append(
+            (token, expected_audience)
+        ),
+    )
+
+    assert (
+        auth._get_access_token_from_env_vars_if_exist(con.SCOPE_ONELAKE_DEFAULT)
+        == "onelake_env_token"
+    )
+    assert decoded == [("onelake_env_token", con.ONELAKE_TOKEN_AUDIENCE)]
+
+    # The Azure token is optional and must not be decoded when missing
+    decoded.clear()
+    with pytest.raises(FabricCLIError) as exc_info:
+        auth._get_access_token_from_env_vars_if_exist(con.SCOPE_AZURE_DEFAULT)
+    assert exc_info.value.status_code == con.ERROR_AUTHENTICATION_FAILED
+    assert decoded == []
+
+    with pytest.raises(FabricCLIError) as exc_info:
+        auth._get_access_token_from_env_vars_if_exist(["invalid_scope"])
+    assert "Invalid scope" in str(exc_info.value)
+
+
 # -----------------------------
 # User Mode Tests
 # -----------------------------
@@ -836,6 +825,19 @@ def test_set_access_mode_success(monkeypatch):
     assert auth.get_identity_type() == "service_principal"
 
 
+def test_set_auth_properties_no_write_when_unchanged(monkeypatch):
+    auth = FabAuth()
+    auth.set_access_mode("user")
+
+    with patch.object(auth, "_save_auth") as save_spy:
+        auth.set_access_mode("user")
+        auth._set_auth_properties({con.IDENTITY_TYPE: "user"})
+        save_spy.assert_not_called()
+
+        auth._set_auth_property(con.FAB_TENANT_ID, "tenant-id")
+        save_spy.assert_called_once()
+
+
 def test_set_access_mode_invalid(monkeypatch):
     """Test setting an invalid access mode"""
     auth = FabAuth()
@@ -875,6 +877,142 @@ def test_validate_environment_vars_spn_without_tenant(monkeypatch):
     assert "FAB_TENANT_ID must be set for SPN authentication" in str(exc_info.value)
 
 
+def test_validate_environment_vars_spn_multiple_credentials(monkeypatch):
+    """Test validation fails when more than one SPN credential is set"""
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    monkeypatch.setenv("FAB_TENANT_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("FAB_SPN_CLIENT_ID", "client-id")
+    monkeypatch.setenv("FAB_SPN_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("FAB_SPN_CERT_PATH", "cert.pem")
+
+    with pytest.raises(FabricCLIError) as exc_info:
+        auth._validate_environment_variables()
+    assert exc_info.value.status_code == con.ERROR_AUTHENTICATION_FAILED
+    assert exc_info.value.message == (
+        "Multiple authentication credentials are set "
+        "(FAB_SPN_CERT_PATH, FAB_SPN_CLIENT_SECRET). Only one of "
+        "FAB_SPN_CLIENT_SECRET, FAB_SPN_CERT_PATH or FAB_SPN_FEDERATED_TOKEN can be set"
+    )
+
+    monkeypatch.delenv("FAB_SPN_CERT_PATH")
+    auth._validate_environment_variables()
+
+
+def test_validate_environment_vars_spn_missing_credential(monkeypatch):
+    """Test validation fails when no SPN credential is set"""
+    _clear_environment_variables(monkeypatch)
+    monkeypatch.delenv("FAB_SPN_FEDERATED_TOKEN", raising=False)
+    auth = FabAuth()
+    monkeypatch.setenv("FAB_TENANT_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("FAB_SPN_CLIENT_ID", "client-id")
+
+    with pytest.raises(FabricCLIError) as exc_info:
+        auth._validate_environment_variables()
+    assert "Authentication credential is missing" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        ("5814bfb4-2705-4994-b8d6-39aabeb5eaeb", True),
+        ("5814BFB4-2705-4994-B8D6-39AABEB5EAEB", True),
+        ("5814bfb427054994b8d639aabeb5eaeb", False),
+        ("{5814bfb4-2705-4994-b8d6-39aabeb5eaeb}", False),
+        ("5814bfb4-2705-4994-b8d6-39aabeb5eaeb\n", False),
+        ("client-id", False),
+        ("", False),
+    ],
+)
+def test_verify_valid_guid_parameter(value, is_valid):
+    if is_valid:
+        FabAuth._verify_valid_guid_parameter(value, "FAB_TENANT_ID")
+    else:
+        with pytest.raises(FabricCLIError) as exc_info:
+            FabAuth._verify_valid_guid_parameter(value, "FAB_TENANT_ID")
+        assert exc_info.value.status_code == con.ERROR_INVALID_GUID
+
+
+def test_decode_dict_recursively():
+    auth = FabAuth()
+    decoded = auth._decode_dict_recursively(
+        {
+            "bytes": b"value",
+            "bytearray": bytearray(b"other"),
+            "nested": {"inner": b"x", "n": 1},
+            "plain": 2,
+        }
+    )
+    assert decoded == {
+        "bytes": "value",
+        "bytearray": "other",
+        "nested": '{"inner":"x","n":1}',
+        "plain": 2,
+    }
+
+
+def test_get_persistence_built_once_until_logout(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    auth._persistence = None
+
+    built = []
+    monkeypatch.setattr(
+        auth, "_build_persistence", lambda: built.append(object()) or built[-1]
+    )
+
+    first = auth._get_persistence()
+    assert auth._get_persistence() is first
+    assert len(built) == 1
+
+    auth.logout()
+    assert auth._get_persistence() is not first
+    assert len(built) == 2
+
+
+def test_fab_auth_singleton():
+    auth = FabAuth()
+    auth._auth_info[con.FAB_TOKEN] = "dummy_token"
+
+    # Subsequent instantiations return the same, already initialized instance
+    assert FabAuth() is auth
+    assert isinstance(auth, FabAuth)
+    assert FabAuth()._auth_info[con.FAB_TOKEN] == "dummy_token"
+
+
+def test_load_env_spn_secret(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    tenant_id = str(uuid.uuid4())
+    client_id = str(uuid.uuid4())
+    monkeypatch.setenv("FAB_TENANT_ID", tenant_id)
+    monkeypatch.setenv("FAB_SPN_CLIENT_ID", client_id)
+    monkeypatch.setenv("FAB_SPN_CLIENT_SECRET", "secret")
+
+    calls = {}
+    monkeypatch.setattr(auth, "set_tenant", lambda tid: calls.update(tenant=tid))
+    monkeypatch.setattr(
+        auth, "set_spn", lambda cid, secret: calls.update(spn=(cid, secret))
+    )
+
+    auth._load_env()
+    assert calls == {"tenant": tenant_id, "spn": (client_id, "secret")}
+
+
+def test_load_env_managed_identity(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    monkeypatch.setenv("FAB_MANAGED_IDENTITY", "True")
+
+    calls = {}
+    monkeypatch.setattr(
+        auth, "set_managed_identity", lambda cid: calls.update(client_id=cid)
+    )
+
+    auth._load_env()
+    assert calls == {"client_id": None}
+
+
 def test_is_token_defined_fabric(monkeypatch):
     """Test checking if Fabric token is defined"""
     auth = FabAuth()
@@ -905,10 +1043,8 @@ def test_get_claims_from_token_multiple_claims(monkeypatch):
     dummy_token = "dummy.token"
     dummy_payload = {"sub": "123", "name": "Test User", "email": "test@example.com"}
 
-    # Mock _decode_jwt_token to return our dummy payload
-    monkeypatch.setattr(
-        auth, "_decode_jwt_token", lambda token, expected_audience=None: dummy_payload
-    )
+    # Mock _get_unverified_claims to return our dummy payload
+    monkeypatch.setattr(auth, "_get_unverified_claims", lambda token: dummy_payload)
 
     claims = auth._get_claims_from_token(dummy_token, ["sub", "name", "email"])
     assert claims == {"sub": "123", "name": "Test User", "email": "test@example.com"}
@@ -921,10 +1057,8 @@ def test_get_claims_from_token_missing_claims(monkeypatch):
     dummy_token = "dummy.token"
     dummy_payload = {"sub": "123", "name": "Test User"}
 
-    # Mock _decode_jwt_token to return our dummy payload
-    monkeypatch.setattr(
-        auth, "_decode_jwt_token", lambda token, expected_audience=None: dummy_payload
-    )
+    # Mock _get_unverified_claims to return our dummy payload
+    monkeypatch.setattr(auth, "_get_unverified_claims", lambda token: dummy_payload)
 
     claims = auth._get_claims_from_token(dummy_token, ["sub", "name", "email"])
     assert claims == {
@@ -933,15 +1067,27 @@ def test_get_claims_from_token_missing_claims(monkeypatch):
     }
 
 
+def test_get_unverified_claims():
+    """Test that claims are read from the token without verifying it"""
+    auth = FabAuth()
+
+    token = jwt.encode({"aud": "any", "tid": "tenant"}, "k" * 32)
+    assert auth._get_claims_from_token(token, ["tid"]) == {"tid": "tenant"}
+
+    with pytest.raises(FabricCLIError) as exc_info:
+        auth._get_unverified_claims("InvalidToken")
+    assert exc_info.value.status_code == con.ERROR_AUTHENTICATION_FAILED
+
+
 def test_get_claims_from_token_decode_error(monkeypatch):
     """Test getting claims when token decoding fails"""
     auth = FabAuth()
 
-    # Mock _decode_jwt_token to raise an exception
+    # Mock _get_unverified_claims to raise an exception
     def mock_decode_error(*args, **kwargs):
         raise FabricCLIError("Failed to decode token", con.ERROR_AUTHENTICATION_FAILED)
 
-    monkeypatch.setattr(auth, "_decode_jwt_token", mock_decode_error)
+    monkeypatch.setattr(auth, "_get_unverified_claims", mock_decode_error)
 
     with pytest.raises(FabricCLIError) as exc_info:
         auth._get_claims_from_token("dummy.token", ["sub"])
@@ -986,6 +1132,31 @@ def test_auth_file_cleanup_on_logout(monkeypatch):
         assert file_content == {}, "Auth file should be empty after logout"
 
 
+def test_logout_resets_config_in_single_write(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    monkeypatch.setattr(auth, "_save_auth", lambda: None)
+    monkeypatch.setattr(auth, "cache_file", "nonexistent_cache.bin")
+
+    batched = []
+    monkeypatch.setattr(
+        fab_auth_module.config, "set_configs", lambda values: batched.append(values)
+    )
+    monkeypatch.setattr(
+        fab_auth_module.config,
+        "set_config",
+        lambda key, value: pytest.fail("set_config should not be called"),
+    )
+
+    auth.logout()
+
+    assert len(batched) == 1
+    assert batched[0][con.FAB_CACHE_ENABLED] == con.CONFIG_DEFAULT_VALUES[
+        con.FAB_CACHE_ENABLED
+    ]
+    assert batched[0][con.FAB_DEFAULT_AZ_LOCATION] == ""
+
+
 def test_get_authority_url(monkeypatch):
     """Test that _get_authority_url returns correct URL based on tenant_id presence"""
     # Clear environment variables
@@ -1039,6 +1210,59 @@ def test_authority_url_migration(tmp_path):
     ), "FAB_AUTHORITY not removed after migration"
 
 
+def test_save_auth_writes_through_unique_temp_file(tmp_path, monkeypatch):
+    auth = FabAuth()
+    auth.auth_file = os.path.join(tmp_path, "auth.json")
+    auth._auth_info = {con.IDENTITY_TYPE: "user"}
+
+    replaced = []
+    real_replace = os.replace
+
+    def tracking_replace(src, dst):
+        replaced.append(src)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", tracking_replace)
+    auth._save_auth()
+    auth._save_auth()
+
+    assert len(set(replaced)) == 2
+    assert all(os.path.dirname(src) == str(tmp_path) for src in replaced)
+    assert os.listdir(tmp_path) == ["auth.json"]
+    with open(auth.auth_file) as f:
+        assert json.load(f) == {con.IDENTITY_TYPE: "user"}
+
+
+def test_save_auth_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    auth = FabAuth()
+    auth.auth_file = os.path.join(tmp_path, "auth.json")
+    auth._auth_info = {con.IDENTITY_TYPE: "user"}
+
+    def failing_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        auth._save_auth()
+
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("content", [None, ""])
+def test_load_auth_missing_or_empty_file(tmp_path, content):
+    auth_file = os.path.join(tmp_path, "auth.json")
+    if content is not None:
+        with open(auth_file, "w") as f:
+            f.write(content)
+
+    auth = FabAuth()
+    auth.auth_file = auth_file
+    auth._auth_info = {con.IDENTITY_TYPE: "user"}
+    auth._load_auth()
+
+    assert auth._auth_info == {}
+
+
 def test_auth_mode_migration(tmp_path):
     auth_data = {
         con.FAB_AUTHORITY: con.AUTH_DEFAULT_AUTHORITY,
@@ -1050,7 +1274,10 @@ def test_auth_mode_migration(tmp_path):
 
     auth = FabAuth()
     auth.auth_file = os.path.join(tmp_path, "auth.json")
-    auth._load_auth()
+    with patch.object(auth, "_save_auth", wraps=auth._save_auth) as save_spy:
+        auth._load_auth()
+    # Both migrations are persisted with a single write
+    save_spy.assert_called_once()
 
     updated_auth_data = auth._auth_info
 
@@ -1064,3 +1291,96 @@ def test_auth_mode_migration(tmp_path):
     assert (
         auth.get_identity_type() == "user"
     ), "get_identity_type returns wrong value after migration"
+
+
+def test_acquire_token_cached_until_expiry(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    auth._auth_info = {con.IDENTITY_TYPE: "service_principal"}
+    auth._clear_token_cache()
+
+    calls = []
+
+    class FakeApp:
+        def acquire_token_for_client(self, *, scopes):
+            calls.append(scopes)
+            return {"access_token": f"sp_token_{len(calls)}", "expires_in": 3600}
+
+    monkeypatch.setattr(auth, "_get_app", lambda: FakeApp())
+
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_1"
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_1"
+    assert len(calls) == 1
+
+    # Tokens close to expiry are refreshed
+    token, expires_at, stamp = auth._token_cache[
+        fab_auth_module._scope_key(["dummy_scope"])
+    ]
+    auth._token_cache[fab_auth_module._scope_key(["dummy_scope"])] = (
+        token,
+        time.time() + con.AUTH_TOKEN_REFRESH_MARGIN_SECONDS - 1,
+        stamp,
+    )
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_2"
+    assert len(calls) == 2
+
+    auth.logout()
+    assert auth._token_cache == {}
+
+
+def test_acquire_token_cache_dropped_when_persisted_auth_changes(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    auth._auth_info = {con.IDENTITY_TYPE: "service_principal"}
+    auth._clear_token_cache()
+    auth._save_auth()
+
+    calls = []
+
+    class FakeApp:
+        def acquire_token_for_client(self, *, scopes):
+            calls.append(scopes)
+            return {"access_token": f"sp_token_{len(calls)}", "expires_in": 3600}
+
+    monkeypatch.setattr(auth, "_get_app", lambda: FakeApp())
+
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_1"
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_1"
+
+    # Another fab process logs in or out and rewrites the persisted token cache
+    with open(auth.cache_file, "wb") as f:
+        f.write(b"{}")
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_2"
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_2"
+
+    # ...or auth.json
+    mtime_ns = os.stat(auth.auth_file).st_mtime_ns + 1_000_000_000
+    os.utime(auth.auth_file, ns=(mtime_ns, mtime_ns))
+    assert auth.get_access_token(["dummy_scope"]) == "sp_token_3"
+    assert len(calls) == 3
+
+
+def test_msal_bridge_cached_token_reports_remaining_lifetime(monkeypatch):
+    _clear_environment_variables(monkeypatch)
+    auth = FabAuth()
+    auth._auth_info = {con.IDENTITY_TYPE: "service_principal"}
+    auth._clear_token_cache()
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    class FakeApp:
+        def acquire_token_for_client(self, *, scopes):
+            return {"access_token": "sp_token", "expires_in": 3600}
+
+    monkeypatch.setattr(auth, "_get_app", lambda: FakeApp())
+
+    credential = MsalTokenCredential(auth)
+    first = credential.get_token(con.SCOPE_FABRIC_DEFAULT[0])
+    assert first.expires_on == 1_000_000 + 3600
+
+    # A cache hit later on must keep the original expiry, not extend it
+    now[0] += 1800
+    second = credential.get_token(con.SCOPE_FABRIC_DEFAULT[0])
+    assert second.token == "sp_token"
+    assert second.expires_on == 1_000_000 + 3600
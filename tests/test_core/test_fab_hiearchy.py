@@ -132,6 +132,51 @@ def test_create_invalid_item_failure():
     assert e.value.status_code == fab_constant.WARNING_INVALID_ITEM_NAME
 
 
+def test_create_item_in_folder_success():
+    tenant = Tenant(name="tenant_name", id="0000")
+    workspace = Workspace(
+        name="workspace_name", id="workspace_id", parent=tenant, type="Workspace"
+    )
+    folder = Folder(name="folder_name", id="folder_id", parent=workspace)
+    subfolder = Folder(name="subfolder_name", id="subfolder_id", parent=folder)
+    item = Item(
+        name="item_name",
+        id="item_id",
+        parent=subfolder,
+        item_type="Notebook",
+    )
+    assert item.parent == subfolder
+    assert item.folder_id == "subfolder_id"
+    assert item.workspace is workspace
+    assert item.workspace is workspace
+
+
+def test_item_extract_friendly_name_path_or_default_success():
+    tenant = Tenant(name="tenant_name", id="0000")
+    workspace = Workspace(
+        name="workspace_name", id="workspace_id", parent=tenant, type="Workspace"
+    )
+    notebook = Item(
+        name="item_name", id="item_id", parent=workspace, item_type="Notebook"
+    )
+    lakehouse = Item(
+        name="item_name", id="item_id", parent=workspace, item_type="Lakehouse"
+    )
+
+    for prop in ITMutablePropMap[ItemType.NOTEBOOK]:
+        for key, path in prop.items():
+            assert notebook.extract_friendly_name_path_or_default(key) == path
+    assert notebook.extract_friendly_name_path_or_default("unknown") == "unknown"
+    assert lakehouse.extract_friendly_name_path_or_default("lakehouse") == "lakehouse"
+
+
+def test_create_item_invalid_parent_failure():
+    tenant = Tenant(name="tenant_name", id="0000")
+
+    with pytest.raises(AssertionError):
+        Item(name="item_name", id="item_id", parent=tenant, item_type="Notebook")
+
+
 def test_create_virtual_item_success():
     tenant = Tenant(name="tenant_name", id="0000")
     workspace = Workspace(
@@ -83,6 +83,19 @@ class TestInteractiveCLI:
             fab_constant.INTERACTIVE_VERSION_COMMANDS
         )
 
+    def test_handle_command_special_commands_skip_tokenizing_success(
+        self, interactive_cli, mock_print_ui, mock_print_log_file_path
+    ):
+        """Test special commands are matched on stripped input without splitting."""
+        with patch(
+            "fabric_cli.core.fab_interactive.utils.split_command"
+        ) as mock_split:
+            result = interactive_cli.handle_command("  quit ")
+
+        assert result is True
+        mock_split.assert_not_called()
+        mock_print_ui.assert_called_with(fab_constant.INTERACTIVE_EXIT_MESSAGE)
+
     # Command Handling Tests - Valid Commands
     def test_handle_command_valid_subcommand_success(
         self, interactive_cli, mock_subparsers, mock_print_log_file_path
@@ -158,6 +171,22 @@ class TestInteractiveCLI:
         assert result is False
         mock_print_log_file_path.assert_called_once()
 
+    def test_handle_command_unbalanced_quote_failure(
+        self, interactive_cli, mock_subparsers, mock_print_log_file_path, monkeypatch
+    ):
+        """Test that input with unbalanced quotes is reported and the session continues."""
+        monkeypatch.setattr("platform.system", lambda: "Linux")
+
+        with patch(
+            "fabric_cli.core.fab_interactive.utils_ui.print_output_error"
+        ) as mock_print_error:
+            result = interactive_cli.handle_command("ls John's.Workspace")
+
+        assert result is False
+        error = mock_print_error.call_args.args[0]
+        assert error.status_code == fab_constant.ERROR_INVALID_INPUT
+        mock_subparsers.choices["ls"].parse_args.assert_not_called()
+
     # Exception Handling Tests
     def test_handle_command_system_exit_exception_success(
         self, interactive_cli, mock_subparsers, mock_print_log_file_path
@@ -267,6 +296,25 @@ class TestInteractiveCLI:
         # Verify context was used in prompt
         mock_html_escape.assert_called_once_with("/test/workspace")
 
+    def test_start_interactive_prompt_reused_for_same_context_success(
+        self, interactive_cli, mock_html_escape, mock_context
+    ):
+        """Test the prompt is built once while the context path is unchanged."""
+        interactive_cli.session.prompt.reset_mock()
+        interactive_cli.session.prompt.side_effect = ["help", "version", "quit"]
+
+        with patch.object(
+            interactive_cli, "handle_command", side_effect=lambda cmd: cmd == "quit"
+        ):
+            interactive_cli.start_interactive()
+
+        mock_html_escape.assert_called_once_with("/test/workspace")
+        prompts = [
+            call.args[0] for call in interactive_cli.session.prompt.call_args_list
+        ]
+        assert len(prompts) == 3
+        assert prompts[0] is prompts[1] is prompts[2]
+
     def test_start_interactive_multiple_commands_success(self, interactive_cli):
         """Test handling multiple commands before exit."""
         # Configure multiple commands
@@ -4,6 +4,7 @@
 import json
 import os
 import tempfile
+from unittest.mock import MagicMock
 
 import fabric_cli.core.fab_state_config as cfg
 from fabric_cli.core import fab_constant
@@ -58,6 +59,48 @@ class TestStateConfig:
             assert cfg.get_config("key") == "value"
             assert cfg.get_config("key2") == "value2"
 
+    def test_set_configs__single_write(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg_file = os.path.join(tmpdir, "tmp_cfg.txt")
+            with open(cfg_file, "w") as cfg_fp:
+                cfg_fp.write('{"key": "value", "key2": "old"}')
+            monkeypatch.setattr(cfg, "config_file", cfg_file)
+
+            tracking_write = MagicMock(wraps=cfg.write_config)
+            monkeypatch.setattr(cfg, "write_config", tracking_write)
+
+            cfg.set_configs({"key2": "value2", "key3": "value3"})
+
+            assert tracking_write.call_count == 1
+            assert cfg.list_configs() == {
+                "key": "value",
+                "key2": "value2",
+                "key3": "value3",
+            }
+
+    def test_get_config__parses_file_once_until_changed(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg_file = os.path.join(tmpdir, "tmp_cfg.txt")
+            with open(cfg_file, "w") as cfg_fp:
+                cfg_fp.write('{"key": "value"}')
+            monkeypatch.setattr(cfg, "config_file", cfg_file)
+
+            tracking_read = MagicMock(wraps=cfg.read_config)
+            monkeypatch.setattr(cfg, "read_config", tracking_read)
+
+            assert cfg.get_config("key") == "value"
+            assert cfg.get_config("key") == "value"
+            assert tracking_read.call_count == 1
+
+            # Writes through set_config are visible immediately
+            cfg.set_config("key", "other")
+            assert cfg.get_config("key") == "other"
+
+            # So are external edits to the file
+            with open(cfg_file, "w") as cfg_fp:
+                cfg_fp.write('{"key": "external_value"}')
+            assert cfg.get_config("key") == "external_value"
+
     def test_list_configs(self, monkeypatch):
         with tempfile.TemporaryDirectory() as tmpdir:
             tmp_file = os.path.join(tmpdir, "tmp_test.txt")
@@ -74,10 +117,6 @@ class TestInitDefaults:
 
     def test_init_defaults_no_write_when_unchanged_success(self, tmp_path, monkeypatch):
         """Test that init_defaults skips writing when config already has all defaults."""
-        import json
-
-        from fabric_cli.core import fab_constant
-
         # Create a config file with all defaults already set
         config_data = dict(fab_constant.CONFIG_DEFAULT_VALUES)
         config_file = tmp_path / "config.json"
@@ -86,19 +125,13 @@ class TestInitDefaults:
         monkeypatch.setattr(cfg, "config_file", str(config_file))
 
         # Track write calls
-        original_write = cfg.write_config
-        write_calls = []
-
-        def tracking_write(data):
-            write_calls.append(data)
-            original_write(data)
-
+        tracking_write = MagicMock(wraps=cfg.write_config)
         monkeypatch.setattr(cfg, "write_config", tracking_write)
 
         cfg.init_defaults()
 
         # Should NOT have written since nothing changed
-        assert len(write_calls) == 0, "Should skip write when config unchanged"
+        assert tracking_write.call_count == 0, "Should skip write when config unchanged"
 
 
 # region init_defaults migration
@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -32,6 +32,85 @@ class TestMainModule:
                     
                     mock_start_interactive.assert_called_once()
 
+    def test_main_command_list_keeps_quoted_arguments_success(self):
+        """Test that -c commands are tokenized with shell quoting rules."""
+        from fabric_cli.main import main
+
+        args = MagicMock(command=["ls 'My Workspace.Workspace' -l"])
+        parser = MagicMock()
+        parser.parse_args.return_value = args
+        ls_subparser = MagicMock()
+        ls_subparser.parse_args.return_value = MagicMock(func=lambda a: None)
+        subparsers = MagicMock(choices={"ls": ls_subparser})
+
+        with patch(
+            "fabric_cli.main.get_global_parser_and_subparsers",
+            return_value=(parser, subparsers),
+        ), patch("fabric_cli.core.fab_state_config.init_defaults"), patch(
+            "fabric_cli.main.fab_logger.print_log_file_path"
+        ), patch(
+            "fabric_cli.main.Command.get_command_path"
+        ):
+            with pytest.raises(SystemExit):
+                main()
+
+        ls_subparser.parse_args.assert_called_once_with(
+            ["My Workspace.Workspace", "-l"]
+        )
+
+    def test_main_command_list_unbalanced_quote_failure(self, monkeypatch):
+        """Test that an unbalanced quote in a -c command is reported clearly."""
+        from fabric_cli import main as main_module
+
+        monkeypatch.setattr("platform.system", lambda: "Linux")
+        args = MagicMock(command=["cd John's.Workspace"], output_format="text")
+        parser = MagicMock()
+        parser.parse_args.return_value = args
+        subparsers = MagicMock(choices={})
+
+        with patch(
+            "fabric_cli.main.get_global_parser_and_subparsers",
+            return_value=(parser, subparsers),
+        ), patch("fabric_cli.core.fab_state_config.init_defaults"), patch(
+            "fabric_cli.main.fab_logger.print_log_file_path"
+        ), patch(
+            "fabric_cli.main.fab_ui.print_output_error"
+        ) as mock_print_error:
+            with pytest.raises(SystemExit) as exc_info:
+                main_module.main()
+
+        assert exc_info.value.code == 1
+        error = mock_print_error.call_args.args[0]
+        assert error.status_code == "InvalidInput"
+        assert "No closing quotation" in error.message
+
+    @pytest.mark.parametrize("completing", [False, True])
+    def test_main_autocomplete_only_when_completing_success(
+        self, monkeypatch, completing
+    ):
+        """Test that argcomplete only runs when the shell requests completions."""
+        from fabric_cli.main import main
+
+        if completing:
+            monkeypatch.setenv("_ARGCOMPLETE", "1")
+        else:
+            monkeypatch.delenv("_ARGCOMPLETE", raising=False)
+
+        parser = MagicMock()
+        parser.parse_args.return_value = MagicMock(command=None, version=True)
+
+        with patch(
+            "fabric_cli.main.get_global_parser_and_subparsers",
+            return_value=(parser, MagicMock()),
+        ), patch("argcomplete.autocomplete") as mock_autocomplete, patch(
+            "fabric_cli.core.fab_state_config.init_defaults"
+        ), patch(
+            "fabric_cli.main.fab_ui.print_version"
+        ):
+            main()
+
+        assert mock_autocomplete.called is completing
+
     def test_start_interactive_mode_directly_success(self):
         """Test that start_interactive_mode can be called directly without infinite loops."""
         # Mock the InteractiveCLI to prevent actual interactive session
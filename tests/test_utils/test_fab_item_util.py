@@ -9,33 +9,61 @@ import pytest
 import fabric_cli.utils.fab_item_util as item_utils
 from fabric_cli.client import fab_api_item as item_api
 from fabric_cli.commands.fs.export import fab_fs_export_item as _export_item
-from fabric_cli.core import fab_constant, fab_state_config
-from fabric_cli.core.fab_types import OneLakeItemType
-from fabric_cli.core.hiearchy.fab_hiearchy import Item, OneLakeItem, Tenant, Workspace
+from fabric_cli.core.fab_types import ItemType, OneLakeItemType
+from fabric_cli.core.hiearchy.fab_hiearchy import (
+    Folder,
+    Item,
+    OneLakeItem,
+    Tenant,
+    Workspace,
+)
 
+_NON_EXPORTED_ITEM = {"item_non_exported": "item"}
+_NON_EXPORTED_ITEM_RESPONSE = Namespace(text=json.dumps(_NON_EXPORTED_ITEM))
 
-def test_extract_paths():
+
+def _mock_export_single_item(*args, **kwargs):
+    return {"item_exported": "item"}
+
+
+def _mock_get_item(*args, **kwargs):
+    return _NON_EXPORTED_ITEM_RESPONSE
+
+
+@pytest.fixture(scope="module")
+def workspace():
     tenant = Tenant(name="tenant_name", id="0000")
-    workspace = Workspace(
+    return Workspace(
         name="workspace_name", id="workspace_id", parent=tenant, type="Workspace"
     )
-    item = Item(
-        name="item_name",
-        id="item_id",
-        parent=workspace,
-        item_type="Lakehouse",
-    )
+
+
+@pytest.fixture
+def make_item(workspace):
+    def _make_item(name, id, item_type):
+        return Item(name=name, id=id, parent=workspace, item_type=item_type)
+
+    return _make_item
+
+
+@pytest.fixture(scope="module")
+def onelake_folder(workspace):
+    """The Files/path/to folder of a Lakehouse, shared by the OneLake path tests."""
+    item = Item(name="item_name", id="item_id", parent=workspace, item_type="Lakehouse")
     root_folder = OneLakeItem(
         "Files", "0000", parent=item, nested_type=OneLakeItemType.FOLDER
     )
     lvl1_folder = OneLakeItem(
         "path", "0000", parent=root_folder, nested_type=OneLakeItemType.FOLDER
     )
-    lvl2_folder = OneLakeItem(
+    return OneLakeItem(
         "to", "0000", parent=lvl1_folder, nested_type=OneLakeItemType.FOLDER
     )
+
+
+def test_extract_paths(onelake_folder):
     lvl3_folder = OneLakeItem(
-        "item", "0000", parent=lvl2_folder, nested_type=OneLakeItemType.FILE
+        "item", "0000", parent=onelake_folder, nested_type=OneLakeItemType.FILE
     )
     path_id, path_name = item_utils.extract_paths(lvl3_folder)
     assert path_id == "workspace_id/item_id/Files/path/to/item"
@@ -44,31 +72,12 @@ def test_extract_paths():
     )
 
 
-def test_obtain_id_names_for_onelake():
-    tenant = Tenant(name="tenant_name", id="0000")
-    workspace = Workspace(
-        name="workspace_name", id="workspace_id", parent=tenant, type="Workspace"
-    )
-    item = Item(
-        name="item_name",
-        id="item_id",
-        parent=workspace,
-        item_type="Lakehouse",
-    )
-    root_folder = OneLakeItem(
-        "Files", "0000", parent=item, nested_type=OneLakeItemType.FOLDER
-    )
-    lvl1_folder = OneLakeItem(
-        "path", "0000", parent=root_folder, nested_type=OneLakeItemType.FOLDER
-    )
-    lvl2_folder = OneLakeItem(
-        "to", "0000", parent=lvl1_folder, nested_type=OneLakeItemType.FOLDER
-    )
+def test_obtain_id_names_for_onelake(onelake_folder):
     from_item = OneLakeItem(
-        "item_from", "0000", parent=lvl2_folder, nested_type=OneLakeItemType.FILE
+        "item_from", "0000", parent=onelake_folder, nested_type=OneLakeItemType.FILE
     )
     to_item = OneLakeItem(
-        "item_to", "0000", parent=lvl2_folder, nested_type=OneLakeItemType.FILE
+        "item_to", "0000", parent=onelake_folder, nested_type=OneLakeItemType.FILE
     )
     from_path_id, from_path_name, to_path_id, to_path_name = (
         item_utils.obtain_id_names_for_onelake(from_item, to_item)
@@ -85,40 +94,69 @@ def test_obtain_id_names_for_onelake():
     )
 
 
-def test_get_item_with_definition(monkeypatch):
-    tenant = Tenant(name="tenant_name", id="0000")
-    workspace = Workspace(
-        name="workspace_name", id="workspace_id", parent=tenant, type="Workspace"
-    )
-    non_export_item = Item(
-        name="dashboard_name",
-        id="dashboard_id",
-        parent=workspace,
-        item_type="Dashboard",
-    )
-
-    export_item = Item(
-        name="nt_name",
-        id="ntid",
-        parent=workspace,
-        item_type="Notebook",
-    )
-
-    def mock_export_item(*args, **kwargs):
-        return {"item_exported": "item"}
+def test_get_item_with_definition(monkeypatch, make_item):
+    non_export_item = make_item("dashboard_name", "dashboard_id", "Dashboard")
+    export_item = make_item("nt_name", "ntid", "Notebook")
 
-    monkeypatch.setattr(_export_item, "export_single_item", mock_export_item)
-
-    def mock_get_item(*args, **kwargs):
-        args = Namespace()
-        args.text = json.dumps({"item_non_exported": "item"})
-        return args
-
-    monkeypatch.setattr(item_api, "get_item", mock_get_item)
+    monkeypatch.setattr(_export_item, "export_single_item", _mock_export_single_item)
+    monkeypatch.setattr(item_api, "get_item", _mock_get_item)
 
     _args = Namespace()
     item = item_utils.get_item_with_definition(non_export_item, _args)
-    assert item == {"item_non_exported": "item"}
+    assert item == _NON_EXPORTED_ITEM
 
     item = item_utils.get_item_with_definition(export_item, _args)
     assert item == {"item_exported": "item"}
+
+
+def test_get_external_data_share_name():
+    eds_name = item_utils.get_external_data_share_name(
+        "my_item.Lakehouse", "1a2b3c4d-0000-1111-2222-333344445555"
+    )
+    assert eds_name == "my_item.Lakehouse_1a2b3c4d"
+
+
+@pytest.mark.parametrize(
+    "eds_name, expected",
+    [
+        ("my_item.Lakehouse_1a2b3c4d", "my_item.Lakehouse"),
+        ("item.Warehouse_1a2b3c4d", "item.Warehouse"),
+        ("no-separator", ""),
+    ],
+)
+def test_get_item_name_from_eds_name(eds_name, expected):
+    assert item_utils.get_item_name_from_eds_name(eds_name) == expected
+
+
+def test_item_types_supporting_external_data_shares():
+    supported = item_utils.item_types_supporting_external_data_shares()
+    assert supported == {
+        ItemType.LAKEHOUSE,
+        ItemType.KQL_DATABASE,
+        ItemType.WAREHOUSE,
+    }
+    assert supported is item_utils.item_types_supporting_external_data_shares()
+
+
+@pytest.mark.parametrize(
+    "sort_criteria, expected",
+    [
+        ("byname", ["a_nb", "b_folder", "c_lh"]),
+        ("bytype", ["b_folder", "c_lh", "a_nb"]),
+    ],
+)
+def test_sort_ws_elems_by_config(
+    monkeypatch, workspace, make_item, sort_criteria, expected
+):
+    elems = [
+        make_item("c_lh", "1", "Lakehouse"),
+        make_item("a_nb", "2", "Notebook"),
+        Folder(name="b_folder", id="3", parent=workspace),
+    ]
+    monkeypatch.setattr(
+        item_utils.fab_state_config, "get_config", lambda key: sort_criteria
+    )
+
+    sorted_elems = item_utils.sort_ws_elems_by_config(elems)
+
+    assert [elem.short_name for elem in sorted_elems] == expected
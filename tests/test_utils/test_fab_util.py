@@ -263,6 +263,45 @@ def test_get_os_specific_command(monkeypatch):
     assert result == "unknown_command"
 
 
+@pytest.mark.parametrize(
+    "system, command, expected",
+    [
+        (
+            "Linux",
+            "ls 'My Workspace.Workspace' -l",
+            ["ls", "My Workspace.Workspace", "-l"],
+        ),
+        (
+            "Linux",
+            'set ws.Workspace -q displayName -i "a b"',
+            ["set", "ws.Workspace", "-q", "displayName", "-i", "a b"],
+        ),
+        (
+            "Windows",
+            "ls 'My Workspace.Workspace' -l",
+            ["ls", "My Workspace.Workspace", "-l"],
+        ),
+        ("Windows", "cd John's.Workspace", ["cd", "John's.Workspace"]),
+        (
+            "Windows",
+            r"import ws.Workspace/nb.Notebook -i C:\exports\nb",
+            ["import", "ws.Workspace/nb.Notebook", "-i", r"C:\exports\nb"],
+        ),
+    ],
+)
+def test_split_command(monkeypatch, system, command, expected):
+    monkeypatch.setattr("platform.system", lambda: system)
+    assert utils.split_command(command) == expected
+
+
+def test_split_command_unbalanced_quote(monkeypatch):
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    with pytest.raises(utils.FabricCLIError) as exc_info:
+        utils.split_command("cd John's.Workspace")
+    assert exc_info.value.status_code == fab_constant.ERROR_INVALID_INPUT
+    assert "No closing quotation" in exc_info.value.message
+
+
 def test_get_capacity_settings(monkeypatch):
     _config = {
         fab_constant.FAB_DEFAULT_AZ_SUBSCRIPTION_ID: None,
@@ -4,19 +4,23 @@
 """Tests for lazy loading utilities and startup performance."""
 
 import importlib
+import json
+import os
+import subprocess
 import sys
-import time
+import types
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from fabric_cli.utils.fab_lazy_load import lazy_command
+
 
 class TestLazyLoad:
     """Test suite for lazy loading utilities."""
 
     def test_lazy_command__deferred_import(self):
         """Test that lazy_command defers the module import until invocation."""
-        from fabric_cli.utils.fab_lazy_load import lazy_command
-
         mod_path = "fabric_cli.commands.auth.fab_auth"
 
         # Ensure clean state
@@ -38,13 +42,7 @@ class TestLazyLoad:
 
     def test_lazy_command__invokes_target_function(self):
         """Test that lazy_command correctly resolves and calls the target function."""
-        from unittest.mock import MagicMock
-
-        from fabric_cli.utils.fab_lazy_load import lazy_command
-
         # Create a test module with a mock function
-        import types
-
         test_mod = types.ModuleType("_test_lazy_mod")
         test_mod.my_func = MagicMock(return_value=42)
         sys.modules["_test_lazy_mod"] = test_mod
@@ -59,80 +57,91 @@ class TestLazyLoad:
         finally:
             del sys.modules["_test_lazy_mod"]
 
+    def test_lazy_command__imports_module_once(self):
+        """Test that lazy_command imports the module on first call only."""
+        test_mod = types.ModuleType("_test_lazy_mod")
+        test_mod.my_func = MagicMock(return_value=42)
+        sys.modules["_test_lazy_mod"] = test_mod
+
+        try:
+            wrapper = lazy_command("_test_lazy_mod", "my_func")
+            with patch(
+                "fabric_cli.utils.fab_lazy_load.importlib.import_module",
+                wraps=importlib.import_module,
+            ) as mock_import:
+                wrapper(None)
+                wrapper(None)
+                assert mock_import.call_count == 1
+
+            # The function is still looked up per call, so patches apply
+            test_mod.my_func = MagicMock(return_value=7)
+            assert wrapper(None) == 7
+        finally:
+            del sys.modules["_test_lazy_mod"]
+
     def test_lazy_command__raises_on_missing_module(self):
         """Test that lazy_command raises ModuleNotFoundError for invalid modules."""
-        from fabric_cli.utils.fab_lazy_load import lazy_command
-
         wrapper = lazy_command("nonexistent.module", "func")
         with pytest.raises(ModuleNotFoundError):
             wrapper(None)
 
     def test_lazy_command__raises_on_missing_function(self):
         """Test that lazy_command raises AttributeError for invalid function names."""
-        from fabric_cli.utils.fab_lazy_load import lazy_command
-
         wrapper = lazy_command("fabric_cli.core.fab_constant", "nonexistent_func")
         with pytest.raises(AttributeError):
             wrapper(None)
 
 
+@pytest.fixture(scope="module")
+def cold_import_probe():
+    """Import fabric_cli.main in a fresh interpreter and report what it cost."""
+    probe = (
+        "import importlib, json, sys, time; "
+        "start = time.perf_counter(); "
+        "main = importlib.import_module('fabric_cli.main'); "
+        "elapsed_ms = (time.perf_counter() - start) * 1000; "
+        "print(json.dumps({'elapsed_ms': elapsed_ms, 'modules': list(sys.modules), "
+        "'file': main.__file__}))"
+    )
+    # The child does not inherit pytest's pythonpath, so point it at the tree under test
+    src_dir = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src")
+    )
+    pythonpath = os.pathsep.join(filter(None, [src_dir, os.environ.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+    )
+    cold_import = json.loads(result.stdout)
+    assert os.path.abspath(cold_import["file"]).startswith(src_dir + os.sep)
+    return cold_import
+
+
 class TestStartupPerformance:
     """Test suite for CLI startup performance."""
 
-    def test_main_module_import__under_threshold(self):
+    def test_main_module_import__under_threshold(self, cold_import_probe):
         """Test that importing the main module stays under performance threshold."""
-        # Remove cached modules to get a fresh import measurement
-        modules_to_remove = [
-            key for key in sys.modules if key.startswith("fabric_cli")
-        ]
-        saved_modules = {}
-        for mod in modules_to_remove:
-            saved_modules[mod] = sys.modules.pop(mod)
+        elapsed_ms = cold_import_probe["elapsed_ms"]
 
-        try:
-            start = time.perf_counter()
-            importlib.import_module("fabric_cli.main")
-            elapsed_ms = (time.perf_counter() - start) * 1000
-
-            # The import should complete in under 500ms (generous threshold)
-            # Before optimization: ~737ms, after: ~54ms
-            assert elapsed_ms < 500, (
-                f"fabric_cli.main import took {elapsed_ms:.0f}ms, expected < 500ms"
-            )
-        finally:
-            # Restore modules
-            for mod_name, mod in saved_modules.items():
-                sys.modules[mod_name] = mod
+        # The import should complete in under 500ms (generous threshold)
+        # Before optimization: ~737ms, after: ~54ms
+        assert elapsed_ms < 500, (
+            f"fabric_cli.main import took {elapsed_ms:.0f}ms, expected < 500ms"
+        )
 
-    def test_heavy_modules_not_imported_at_startup(self):
+    def test_heavy_modules_not_imported_at_startup(self, cold_import_probe):
         """Test that heavy dependencies are NOT loaded during main module import."""
-        # Remove cached modules
-        modules_to_remove = [
-            key for key in sys.modules if key.startswith("fabric_cli")
-        ]
-        saved_modules = {}
-        for mod in modules_to_remove:
-            saved_modules[mod] = sys.modules.pop(mod)
-
-        # Also remove the heavy dependencies
-        heavy_modules = ["msal", "jwt", "cryptography"]
-        saved_heavy = {}
-        for mod_name in heavy_modules:
-            keys_to_remove = [k for k in sys.modules if k.startswith(mod_name)]
-            for k in keys_to_remove:
-                saved_heavy[k] = sys.modules.pop(k)
-
-        try:
-            importlib.import_module("fabric_cli.main")
-
-            # These heavy modules should NOT be imported during startup
-            for mod_name in heavy_modules:
-                assert mod_name not in sys.modules, (
-                    f"'{mod_name}' should not be imported at startup"
-                )
-        finally:
-            # Restore all modules
-            for mod_name, mod in saved_modules.items():
-                sys.modules[mod_name] = mod
-            for mod_name, mod in saved_heavy.items():
-                sys.modules[mod_name] = mod
+        # Group by top-level package so submodules are caught as well
+        loaded_packages = {
+            name.partition(".")[0] for name in cold_import_probe["modules"]
+        }
+
+        # These heavy modules should NOT be imported during startup
+        for mod_name in ["msal", "jwt", "cryptography"]:
+            assert mod_name not in loaded_packages, (
+                f"'{mod_name}' should not be imported at startup"
+            )